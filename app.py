@@ -8,28 +8,44 @@ available and pulled, listening on http://localhost:11434.
 """
 
 from pathlib import Path
+from typing import NamedTuple
 
 import streamlit as st
 
-from modernizer.orchestrator import ModernizationOrchestrator
-
 
 PROJECT_ROOT = Path(__file__).parent.resolve()
 
 
-TEXT_FILE_EXTENSIONS = {
-    ".py",
-    ".md",
-    ".txt",
-    ".json",
-    ".yaml",
-    ".yml",
-    ".toml",
-    ".ini",
-    ".cfg",
-    ".env",
+class RunOutput(NamedTuple):
+    """Locations produced by the latest modernization run."""
+
+    zip_path: Path
+    docs_dir: Path
+    artifacts_dir: Path
+
+
+# Human-readable file extensions mapped to their `st.code` highlighting language
+TEXT_FILE_LANGUAGES = {
+    ".py": "python",
+    ".md": "markdown",
+    ".txt": "text",
+    ".json": "json",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+    ".toml": "toml",
+    ".ini": "ini",
+    ".cfg": "ini",
+    ".env": "bash",
 }
 
+# Generated documents shown in the Business Docs tab, in display order
+DOCS_TAB_DOCUMENTS = (
+    ("EXECUTIVE_SUMMARY.md", "Executive Summary"),
+    ("BUSINESS_REQUIREMENTS.md", "Business Requirements"),
+    ("FUNCTIONAL_OVERVIEW.md", "Functional Overview"),
+    ("MIGRATION_PLAN.md", "Migration Plan"),
+)
+
 
 def _safe_read_text(path: Path) -> str:
     """Read text defensively, tolerating non-UTF8 content.
@@ -55,7 +71,7 @@ def _list_text_code_files(base_dir: Path) -> list[Path]:
         for p in base_dir.rglob("*")
         if p.is_file()
         and not p.name.startswith(".")
-        and p.suffix.lower() in TEXT_FILE_EXTENSIONS
+        and p.suffix.lower() in TEXT_FILE_LANGUAGES
     )
 
 
@@ -110,15 +126,6 @@ def main() -> None:
         logs_container = st.container()
         result_container = st.container()
 
-    def log(message: str) -> None:
-        st.session_state["logs"].append(message)
-        with logs_container:
-            st.subheader("Progress")
-            for line in st.session_state["logs"]:
-                st.write(line)
-
-    orchestrator = ModernizationOrchestrator(PROJECT_ROOT)
-
     with progress_tab:
         if st.button("🚀 Modernize Application"):
             st.session_state["logs"] = []
@@ -127,7 +134,22 @@ def main() -> None:
                 st.error("Please enter a GitHub repository URL.")
             else:
                 try:
-                    with st.spinner("Running modernization workflow..."):
+                    # Imported on first use: the agent stack pulls in LangChain
+                    # and GitPython, which would otherwise delay the first page
+                    # render even for sessions that never start a run.
+                    from modernizer.orchestrator import ModernizationOrchestrator
+
+                    orchestrator = ModernizationOrchestrator(PROJECT_ROOT)
+                    with logs_container.status(
+                        "Running modernization workflow...", expanded=True
+                    ) as status:
+
+                        # Append each step as it happens instead of
+                        # re-rendering the whole log on every update.
+                        def log(message: str) -> None:
+                            st.session_state["logs"].append(message)
+                            status.write(message)
+
                         project_context = orchestrator.run(
                             repo_url=repo_url.strip(),
                             backend_stack=backend_stack,
@@ -135,15 +157,16 @@ def main() -> None:
                             database=database,
                             progress_callback=log,
                         )
+                        status.update(label="Modernization workflow complete.", state="complete")
 
                     zip_path = Path(project_context["zip_path"]).resolve()
                     zip_bytes = zip_path.read_bytes()
 
-                    st.session_state["last_run_output"] = {
-                        "zip_path": str(zip_path),
-                        "docs_dir": str(PROJECT_ROOT / "output" / "docs"),
-                        "artifacts_dir": str(PROJECT_ROOT / "output" / "artifacts"),
-                    }
+                    st.session_state["last_run_output"] = RunOutput(
+                        zip_path=zip_path,
+                        docs_dir=PROJECT_ROOT / "output" / "docs",
+                        artifacts_dir=PROJECT_ROOT / "output" / "artifacts",
+                    )
 
                     with result_container:
                         st.success("Modernization completed successfully!")
@@ -156,6 +179,16 @@ def main() -> None:
 
                 except Exception as exc:  # pragma: no cover - UI-focused
                     st.error(f"Error during modernization: {exc}")
+        elif st.session_state["logs"]:
+            # Later reruns (e.g. browsing the other tabs) keep showing the
+            # last run's progress log, collapsed.
+            if st.session_state["last_run_output"] is not None:
+                label, state = "Modernization workflow complete.", "complete"
+            else:
+                label, state = "Last modernization run failed.", "error"
+            with logs_container.status(label, state=state, expanded=False):
+                for line in st.session_state["logs"]:
+                    st.write(line)
 
     with docs_tab:
         st.subheader("Business-Friendly Documentation")
@@ -163,32 +196,21 @@ def main() -> None:
         if not info:
             st.info("Run a modernization first to view generated documents.")
         else:
-            docs_dir = Path(info["docs_dir"])
-            exec_path = docs_dir / "EXECUTIVE_SUMMARY.md"
-            bizreq_path = docs_dir / "BUSINESS_REQUIREMENTS.md"
-            func_path = docs_dir / "FUNCTIONAL_OVERVIEW.md"
-            mig_path = docs_dir / "MIGRATION_PLAN.md"
-
-            def render_doc(path: Path, title: str) -> None:
+            for filename, title in DOCS_TAB_DOCUMENTS:
+                path = info.docs_dir / filename
+                st.markdown(f"### {title}")
                 if path.exists():
-                    st.markdown(f"### {title}")
                     st.markdown(_safe_read_text(path))
                 else:
-                    st.markdown(f"### {title}")
                     st.warning("Document not found in the latest run.")
 
-            render_doc(exec_path, "Executive Summary")
-            render_doc(bizreq_path, "Business Requirements")
-            render_doc(func_path, "Functional Overview")
-            render_doc(mig_path, "Migration Plan")
-
     with code_tab:
         st.subheader("Modernized Backend Starter Code")
         info = st.session_state.get("last_run_output")
         if not info:
             st.info("Run a modernization first to view generated code.")
         else:
-            artifacts_dir = Path(info["artifacts_dir"])
+            artifacts_dir = info.artifacts_dir
             if not artifacts_dir.exists():
                 st.warning("No code artifacts were generated in the latest run.")
             else:
@@ -205,7 +227,7 @@ def main() -> None:
                     st.markdown(f"#### {selected}")
                     st.code(
                         _safe_read_text(file_path),
-                        language="python",
+                        language=TEXT_FILE_LANGUAGES[file_path.suffix.lower()],
                     )
 
 
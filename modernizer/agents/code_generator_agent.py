@@ -12,6 +12,8 @@ from typing import Any, Dict
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from modernizer.utils.files import write_artifact_file
+from modernizer.utils.ollama import forget_cached_response
+from modernizer.utils.prompts import load_prompt, render_prompt, stack_values
 
 
 def _extract_json_block(text: str) -> str:
@@ -56,25 +58,14 @@ class CodeGeneratorAgent:
 
     def run(self, project_context: Dict[str, Any]) -> None:
         plan = project_context["plan"]
-        backend_stack = project_context["backend_stack"]
-        frontend_stack = project_context["frontend_stack"]
-        database = project_context["database"]
-
-        template_path = self.prompts_dir / "code_gen_prompt.md"
-        template = template_path.read_text(encoding="utf-8")
-
-        prompt = template.replace("{{ backend_stack }}", backend_stack)
-        prompt = prompt.replace("{{ frontend_stack }}", frontend_stack)
-        prompt = prompt.replace("{{ database }}", database)
-        prompt = prompt.replace(
-            "{{ target_architecture_summary }}", plan.get("target_architecture_summary", "")
-        )
-        prompt = prompt.replace(
-            "{{ services_json }}", json.dumps(plan.get("services", []), indent=2)
-        )
-        prompt = prompt.replace(
-            "{{ migration_steps }}", json.dumps(plan.get("migration_steps", []), indent=2)
-        )
+
+        template = load_prompt(self.prompts_dir / "code_gen_prompt.md")
+
+        values = stack_values(project_context)
+        values["target_architecture_summary"] = plan.get("target_architecture_summary", "")
+        values["services_json"] = json.dumps(plan.get("services", []), indent=2)
+        values["migration_steps"] = json.dumps(plan.get("migration_steps", []), indent=2)
+        prompt = render_prompt(template, values)
 
         response = self.llm.invoke(prompt)
         raw_text = str(getattr(response, "content", response))
@@ -83,6 +74,9 @@ class CodeGeneratorAgent:
         try:
             spec = json.loads(json_text)
         except json.JSONDecodeError:
+            # Do not replay an unparseable (often truncated) response on
+            # the next run.
+            forget_cached_response(self.llm, prompt)
             # Fallback: create a minimal spec.
             spec = {"folders": ["backend"], "files": []}
 
@@ -90,15 +84,15 @@ class CodeGeneratorAgent:
         for folder in folders:
             (self.artifacts_dir / folder).mkdir(parents=True, exist_ok=True)
 
-        files = spec.get("files", [])
-        for file_desc in files:
+        written_paths = []
+        for file_desc in spec.get("files", []):
             path = file_desc.get("path")
-            contents = file_desc.get("contents", "")
             if not path:
                 continue
-            write_artifact_file(self.artifacts_dir, path, contents)
+            write_artifact_file(self.artifacts_dir, path, file_desc.get("contents", ""))
+            written_paths.append(path)
 
         project_context["generated_code"] = {
             "folders": folders,
-            "files": [f.get("path") for f in files if f.get("path")],
+            "files": written_paths,
         }
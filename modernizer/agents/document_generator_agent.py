@@ -10,6 +10,7 @@ from typing import Any, Dict
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from modernizer.utils.files import DOC_FILENAMES, write_markdown_doc
+from modernizer.utils.prompts import load_prompt, render_prompt, stack_values
 
 
 class DocumentGeneratorAgent:
@@ -21,18 +22,11 @@ class DocumentGeneratorAgent:
         self.docs_dir = docs_dir
 
     def run(self, project_context: Dict[str, Any]) -> None:
-        analysis_summary = project_context["analysis"]["summary_markdown"]
-        backend_stack = project_context["backend_stack"]
-        frontend_stack = project_context["frontend_stack"]
-        database = project_context["database"]
-
-        template_path = self.prompts_dir / "docs_prompt.md"
-        template = template_path.read_text(encoding="utf-8")
-
-        prompt = template.replace("{{ backend_stack }}", backend_stack)
-        prompt = prompt.replace("{{ frontend_stack }}", frontend_stack)
-        prompt = prompt.replace("{{ database }}", database)
-        prompt = prompt.replace("{{ analysis_summary }}", analysis_summary)
+        template = load_prompt(self.prompts_dir / "docs_prompt.md")
+
+        values = stack_values(project_context)
+        values["analysis_summary"] = project_context["analysis"]["summary_markdown"]
+        prompt = render_prompt(template, values)
 
         response = self.llm.invoke(prompt)
         text = str(getattr(response, "content", response))
@@ -10,6 +10,14 @@ from typing import Any, Dict
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
+from modernizer.utils.ollama import forget_cached_response
+from modernizer.utils.prompts import load_prompt, render_prompt, stack_values
+
+
+# For simplicity we do not currently feed full docs; we could extend this by
+# sampling key sections from the generated docs.
+_DOCS_HIGHLIGHTS = "Generated docs are available but omitted for brevity."
+
 
 def _extract_json_block(text: str) -> str:
     """Extract a JSON object from an LLM response.
@@ -53,23 +61,12 @@ class ModernizationPlannerAgent:
         self.prompts_dir = prompts_dir
 
     def run(self, project_context: Dict[str, Any]) -> None:
-        analysis_summary = project_context["analysis"]["summary_markdown"]
-        backend_stack = project_context["backend_stack"]
-        frontend_stack = project_context["frontend_stack"]
-        database = project_context["database"]
-
-        # For simplicity we do not currently feed full docs; we could extend
-        # this by sampling key sections from the generated docs.
-        docs_highlights = "Generated docs are available but omitted for brevity."
-
-        template_path = self.prompts_dir / "planner_prompt.md"
-        template = template_path.read_text(encoding="utf-8")
+        template = load_prompt(self.prompts_dir / "planner_prompt.md")
 
-        prompt = template.replace("{{ backend_stack }}", backend_stack)
-        prompt = prompt.replace("{{ frontend_stack }}", frontend_stack)
-        prompt = prompt.replace("{{ database }}", database)
-        prompt = prompt.replace("{{ analysis_summary }}", analysis_summary)
-        prompt = prompt.replace("{{ docs_highlights }}", docs_highlights)
+        values = stack_values(project_context)
+        values["analysis_summary"] = project_context["analysis"]["summary_markdown"]
+        values["docs_highlights"] = _DOCS_HIGHLIGHTS
+        prompt = render_prompt(template, values)
 
         response = self.llm.invoke(prompt)
         raw_text = str(getattr(response, "content", response))
@@ -78,6 +75,9 @@ class ModernizationPlannerAgent:
         try:
             plan = json.loads(json_text)
         except json.JSONDecodeError:
+            # Do not replay an unparseable (often truncated) response on
+            # the next run.
+            forget_cached_response(self.llm, prompt)
             # Fallback: wrap raw text in a simple plan structure.
             plan = {
                 "target_architecture_summary": raw_text,
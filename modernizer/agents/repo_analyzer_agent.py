@@ -6,11 +6,25 @@ high-level summary suitable for downstream modernization tasks.
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 from langchain_core.language_models.chat_models import BaseChatModel
 
-from modernizer.utils.files import build_file_tree, find_key_artifacts
+from modernizer.utils.files import build_file_tree, find_key_artifacts, list_repo_files
+from modernizer.utils.prompts import load_prompt, render_prompt, stack_values
+
+
+_EMPTY_REPO_SUMMARY = (
+    "## Repository Summary\n\n"
+    "The repository contains no files outside ignored directories, so there "
+    "is no existing code to analyze. Treat this as a greenfield project."
+)
+
+
+def _relative_listing(repo_path: Path, paths: Iterable[Path]) -> str:
+    """Render artifact paths relative to the repo root, one per line."""
+
+    return "\n".join(str(p.relative_to(repo_path)) for p in paths)
 
 
 class RepoAnalyzerAgent:
@@ -22,48 +36,46 @@ class RepoAnalyzerAgent:
 
     def run(self, project_context: Dict[str, Any]) -> None:
         repo_path = Path(project_context["repo_path"]).resolve()
-        backend_stack = project_context["backend_stack"]
-        frontend_stack = project_context["frontend_stack"]
-        database = project_context["database"]
-
-        file_tree = build_file_tree(repo_path)
-        artifacts = find_key_artifacts(repo_path)
-
-        template_path = self.prompts_dir / "repo_analysis_prompt.md"
-        template = template_path.read_text(encoding="utf-8")
-
-        prompt = template.replace("{{ owner }}", project_context["owner"]).replace(
-            "{{ name }}", project_context["name"]
-        )
-        prompt = prompt.replace("{{ backend_stack }}", backend_stack)
-        prompt = prompt.replace("{{ frontend_stack }}", frontend_stack)
-        prompt = prompt.replace("{{ database }}", database)
-        prompt = prompt.replace("{{ file_tree }}", "\n".join(file_tree))
-        prompt = prompt.replace(
-            "{{ readme_paths }}",
-            "\n".join(str(p.relative_to(repo_path)) for p in artifacts["readmes"]),
-        )
-        prompt = prompt.replace(
-            "{{ build_files }}",
-            "\n".join(str(p.relative_to(repo_path)) for p in artifacts["build_files"]),
-        )
-        prompt = prompt.replace(
-            "{{ configs }}",
-            "\n".join(str(p.relative_to(repo_path)) for p in artifacts["configs"]),
-        )
-        prompt = prompt.replace(
-            "{{ entrypoints }}",
-            "\n".join(str(p.relative_to(repo_path)) for p in artifacts["entrypoints"]),
-        )
 
-        response = self.llm.invoke(prompt)
+        # Walk the repository once and share the listing between both scans.
+        repo_files = list_repo_files(repo_path)
+        file_tree = build_file_tree(repo_path, repo_files=repo_files)
+        artifacts = find_key_artifacts(repo_path, repo_files=repo_files)
+
+        if repo_files:
+            summary_markdown = self._summarize(project_context, repo_path, file_tree, artifacts)
+        else:
+            # Nothing for the model to analyze; skip the LLM round trip.
+            summary_markdown = _EMPTY_REPO_SUMMARY
+
         project_context["analysis"] = {
-            "summary_markdown": str(getattr(response, "content", response)),
+            "summary_markdown": summary_markdown,
             "file_tree": file_tree,
             "artifacts": {
-                "readmes": [str(p) for p in artifacts["readmes"]],
-                "build_files": [str(p) for p in artifacts["build_files"]],
-                "configs": [str(p) for p in artifacts["configs"]],
-                "entrypoints": [str(p) for p in artifacts["entrypoints"]],
+                kind: [str(p) for p in paths] for kind, paths in artifacts.items()
             },
         }
+
+    def _summarize(
+        self,
+        project_context: Dict[str, Any],
+        repo_path: Path,
+        file_tree: List[str],
+        artifacts: Dict[str, List[Path]],
+    ) -> str:
+        """Ask the LLM for a markdown summary of the repository."""
+
+        template = load_prompt(self.prompts_dir / "repo_analysis_prompt.md")
+
+        values = stack_values(project_context)
+        values["owner"] = project_context["owner"]
+        values["name"] = project_context["name"]
+        values["file_tree"] = "\n".join(file_tree)
+        values["readme_paths"] = _relative_listing(repo_path, artifacts["readmes"])
+        values["build_files"] = _relative_listing(repo_path, artifacts["build_files"])
+        values["configs"] = _relative_listing(repo_path, artifacts["configs"])
+        values["entrypoints"] = _relative_listing(repo_path, artifacts["entrypoints"])
+        prompt = render_prompt(template, values)
+
+        response = self.llm.invoke(prompt)
+        return str(getattr(response, "content", response))
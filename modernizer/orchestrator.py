@@ -3,12 +3,12 @@
 Coordinates the end-to-end flow:
 1. Validate and clone the GitHub repository.
 2. Analyze the repository.
-3. Generate documentation.
-4. Plan the modernization.
-5. Generate starter code artifacts.
-6. Package everything into a ZIP under /output.
+3. Generate documentation in the background.
+4. Plan the modernization, then generate starter code artifacts.
+5. Package everything into a ZIP under /output.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict
 
@@ -73,14 +73,25 @@ class ModernizationOrchestrator:
         progress_callback("Analyzing repository structure...")
         RepoAnalyzerAgent(llm, self.prompts_dir).run(project_context)
 
-        progress_callback("Generating modernization documentation...")
-        DocumentGeneratorAgent(llm, self.prompts_dir, docs_dir).run(project_context)
+        # Documentation and planning both depend only on the analysis, and
+        # code generation only on the plan, so documentation runs alongside
+        # the planner -> code generator chain. Progress is reported from this
+        # thread since Streamlit calls cannot be made from worker threads.
+        docs_agent = DocumentGeneratorAgent(llm, self.prompts_dir, docs_dir)
+        planner_agent = ModernizationPlannerAgent(llm, self.prompts_dir)
+        code_agent = CodeGeneratorAgent(llm, self.prompts_dir, artifacts_dir)
 
+        progress_callback("Generating modernization documentation...")
         progress_callback("Designing target architecture and migration plan...")
-        ModernizationPlannerAgent(llm, self.prompts_dir).run(project_context)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            docs_future = executor.submit(docs_agent.run, project_context)
+            plan_future = executor.submit(planner_agent.run, project_context)
+
+            plan_future.result()
+            progress_callback("Generating starter backend scaffolding...")
+            code_agent.run(project_context)
 
-        progress_callback("Generating starter backend scaffolding...")
-        CodeGeneratorAgent(llm, self.prompts_dir, artifacts_dir).run(project_context)
+            docs_future.result()
 
         progress_callback("Packaging outputs into ZIP archive...")
         zip_path = self.output_root / "modernization_output.zip"
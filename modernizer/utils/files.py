@@ -3,7 +3,7 @@
 import os
 import zipfile
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional
 
 
 DOC_FILENAMES = [
@@ -35,6 +35,26 @@ _SKIP_DIR_NAMES = {
     ".vscode",
 }
 
+# Lower-cased file names mapped to the key-artifact category they belong to.
+# READMEs are matched by prefix instead since their extensions vary.
+_ARTIFACT_KIND_BY_NAME = {
+    "pom.xml": "build_files",
+    "build.gradle": "build_files",
+    "package.json": "build_files",
+    "requirements.txt": "build_files",
+    "application.yml": "configs",
+    "application.yaml": "configs",
+    "application.properties": "configs",
+    "docker-compose.yml": "configs",
+    "docker-compose.yaml": "configs",
+    "dockerfile": "configs",
+    "app.py": "entrypoints",
+    "main.py": "entrypoints",
+    "server.js": "entrypoints",
+    "index.js": "entrypoints",
+    "index.ts": "entrypoints",
+}
+
 
 def ensure_output_dirs(base_dir: Path) -> Dict[str, Path]:
     """Ensure the standard /output layout exists and return paths.
@@ -54,26 +74,60 @@ def ensure_output_dirs(base_dir: Path) -> Dict[str, Path]:
     return {"root": base_dir, "docs": docs_dir, "artifacts": code_dir}
 
 
-def build_file_tree(repo_path: Path, max_depth: int = 6, max_files: int = 800) -> List[str]:
-    """Return a simple list of relative file paths in the repo.
+def list_repo_files(repo_path: Path) -> List[Path]:
+    """Return the relative paths of all files outside skipped directories.
 
-    Large or deeply nested repositories are truncated using `max_depth`
-    to avoid overwhelming the context window.
+    Callers that need both the file tree and the key artifacts should walk
+    the repository once with this helper and pass the result to both.
     """
 
-    repo_path = repo_path.resolve()
-    files: List[str] = []
+    files: List[Path] = []
+    pending = [(str(repo_path.resolve()), Path())]
 
-    for path in repo_path.rglob("*"):
-        if not path.is_file():
+    while pending:
+        dir_path, rel_dir = pending.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            # Unreadable directories are skipped, as os.walk would.
             continue
 
-        rel = path.relative_to(repo_path)
+        with entries:
+            for entry in entries:
+                # DirEntry answers both checks from the directory listing's
+                # type data; only symlinks cost an extra stat. Symlinked
+                # directories are not followed, and broken links, FIFOs and
+                # the like are dropped.
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune large or irrelevant directories like .git or
+                    # node_modules so the walk never descends into them.
+                    if entry.name not in _SKIP_DIR_NAMES:
+                        pending.append((entry.path, rel_dir / entry.name))
+                elif entry.is_file():
+                    files.append(rel_dir / entry.name)
+
+    return files
+
+
+def build_file_tree(
+    repo_path: Path,
+    max_depth: int = 6,
+    max_files: int = 800,
+    repo_files: Optional[Iterable[Path]] = None,
+) -> List[str]:
+    """Return a simple list of relative file paths in the repo.
 
-        # Skip files under large or irrelevant directories like .git or node_modules
-        if any(part in _SKIP_DIR_NAMES for part in rel.parts):
-            continue
+    Large or deeply nested repositories are truncated using `max_depth`
+    to avoid overwhelming the context window. Pass `repo_files` from
+    `list_repo_files` to reuse an existing walk of the repository.
+    """
+
+    if repo_files is None:
+        repo_files = list_repo_files(repo_path)
+
+    files: List[str] = []
 
+    for rel in repo_files:
         if len(rel.parts) <= max_depth:
             files.append(str(rel))
 
@@ -83,51 +137,44 @@ def build_file_tree(repo_path: Path, max_depth: int = 6, max_files: int = 800) -
     return sorted(files)
 
 
-def find_key_artifacts(repo_path: Path) -> Dict[str, List[Path]]:
-    """Find key project artifacts such as READMEs and build files."""
-
-    repo_path = repo_path.resolve()
-
-    readmes: List[Path] = []
-    build_files: List[Path] = []
-    configs: List[Path] = []
-    entrypoints: List[Path] = []
+def find_key_artifacts(
+    repo_path: Path, repo_files: Optional[Iterable[Path]] = None
+) -> Dict[str, List[Path]]:
+    """Find key project artifacts such as READMEs and build files.
 
-    for path in repo_path.rglob("*"):
-        if not path.is_file():
-            continue
+    Pass `repo_files` from `list_repo_files` to reuse an existing walk of
+    the repository.
+    """
 
-        rel = path.relative_to(repo_path)
+    repo_path = repo_path.resolve()
+    if repo_files is None:
+        repo_files = list_repo_files(repo_path)
+
+    artifacts: Dict[str, List[Path]] = {
+        "readmes": [],
+        "build_files": [],
+        "configs": [],
+        "entrypoints": [],
+    }
 
-        # Skip large or irrelevant directories
-        if any(part in _SKIP_DIR_NAMES for part in rel.parts):
-            continue
+    for rel in repo_files:
+        name = rel.name.lower()
+        kind = "readmes" if name.startswith("readme") else _ARTIFACT_KIND_BY_NAME.get(name)
+        if kind is not None:
+            artifacts[kind].append(repo_path / rel)
 
-        name = path.name.lower()
-
-        if name.startswith("readme"):
-            readmes.append(path)
-        if name in {"pom.xml", "build.gradle", "package.json", "requirements.txt"}:
-            build_files.append(path)
-        if name in {"application.yml", "application.yaml", "application.properties", "docker-compose.yml", "docker-compose.yaml", "dockerfile"}:
-            configs.append(path)
-        if name in {"app.py", "main.py", "server.js", "index.js", "index.ts"}:
-            entrypoints.append(path)
-
-    return {
-        "readmes": readmes,
-        "build_files": build_files,
-        "configs": configs,
-        "entrypoints": entrypoints,
-    }
+    return artifacts
 
 
 def read_text_file(path: Path, max_bytes: int = 16_000) -> str:
-    """Read a text file safely, truncating very large files."""
+    """Read a text file safely, truncating very large files.
+
+    Only the first `max_bytes` are read from disk, so huge files cost no
+    more than small ones.
+    """
 
-    data = path.read_bytes()
-    if len(data) > max_bytes:
-        data = data[:max_bytes]
+    with path.open("rb") as f:
+        data = f.read(max_bytes)
     return data.decode("utf-8", errors="replace")
 
 
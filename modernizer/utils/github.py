@@ -5,13 +5,16 @@ GitPython for clone operations. URL validation is lightweight and avoids
 any cloud LLM usage.
 """
 
+import os
 import re
 import shutil
 import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-from git import Repo, GitCommandError
+from git import Git, GitCommandError, GitError, Repo
 
 
 class GitHubURLValidationError(Exception):
@@ -26,6 +29,19 @@ GITHUB_URL_RE = re.compile(
     r"^(https://github.com/[^/]+/[^/]+(?:.git)?$|git@github.com:[^/]+/[^/]+.git$|[^/]+/[^/]+$)"
 )
 
+# How long a clone is reused for repeated runs against the same repository,
+# provided the remote HEAD has not moved in the meantime
+CLONE_CACHE_TTL_SECONDS = 3600
+
+# Upper bound for the `git ls-remote` freshness check of a cached clone
+LS_REMOTE_TIMEOUT_SECONDS = 15
+
+# (owner, name, depth) -> (monotonic clone time, clone info)
+_CLONE_CACHE: Dict[Tuple[str, str, int], Tuple[float, Dict[str, str]]] = {}
+# Streamlit runs each session's script on its own thread; guard every access
+# to the shared cache. Network calls happen outside the lock.
+_CLONE_CACHE_LOCK = threading.Lock()
+
 
 def parse_github_url(url: str) -> Tuple[str, str]:
     """Parse a GitHub URL into (owner, repo_name).
@@ -77,9 +93,36 @@ def validate_github_url(url: str) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
+def _is_clone_current(url: str, repo_path: Path) -> bool:
+    """Return True if the clone's HEAD matches the remote's current HEAD.
+
+    Uses `git ls-remote`, which only exchanges refs. Credential prompts are
+    disabled so a repository that has since become private or been deleted
+    fails instead of blocking. Any failure to reach the remote or read the
+    clone counts as stale so the caller re-clones.
+    """
+
+    try:
+        remote_head = Git().ls_remote(
+            url,
+            "HEAD",
+            env={"GIT_TERMINAL_PROMPT": "0"},
+            # GitPython does not support kill_after_timeout on Windows.
+            kill_after_timeout=None if os.name == "nt" else LS_REMOTE_TIMEOUT_SECONDS,
+        ).split("\t", 1)[0]
+        return bool(remote_head) and Repo(repo_path).head.commit.hexsha == remote_head
+    except (GitError, ValueError):
+        return False
+
+
 def clone_public_repo(url: str, depth: int = 1) -> Dict[str, str]:
     """Shallow-clone a public GitHub repository into a temp directory.
 
+    Clones are reused for `CLONE_CACHE_TTL_SECONDS` so that re-running the
+    workflow on the same repository, in any URL form, skips the download.
+    A cached clone is only reused while its HEAD still matches the remote's
+    HEAD; after an upstream push the repository is cloned again.
+
     Returns a dictionary with keys:
     - "repo_path": filesystem path to the cloned repo
     - "owner": GitHub owner
@@ -92,6 +135,25 @@ def clone_public_repo(url: str, depth: int = 1) -> Dict[str, str]:
 
     owner, name = parse_github_url(url)
 
+    cache_key = (owner.lower(), name.lower(), depth)
+    with _CLONE_CACHE_LOCK:
+        cached = _CLONE_CACHE.get(cache_key)
+    if cached is not None:
+        cloned_at, clone_info = cached
+        repo_path = Path(clone_info["repo_path"])
+        if (
+            time.monotonic() - cloned_at < CLONE_CACHE_TTL_SECONDS
+            and repo_path.is_dir()
+            and _is_clone_current(url, repo_path)
+        ):
+            return dict(clone_info)
+        # Forget the outdated clone unless another session already replaced
+        # it. Its directory is left in place: another session may still be
+        # analyzing it.
+        with _CLONE_CACHE_LOCK:
+            if _CLONE_CACHE.get(cache_key) is cached:
+                _CLONE_CACHE.pop(cache_key, None)
+
     tmp_dir = Path(tempfile.mkdtemp(prefix="modernizer_repo_"))
     target_dir = tmp_dir / f"{owner}_{name}"
 
@@ -102,4 +164,7 @@ def clone_public_repo(url: str, depth: int = 1) -> Dict[str, str]:
         shutil.rmtree(tmp_dir, ignore_errors=True)
         raise GitCloneError(f"Failed to clone repository: {exc}") from exc
 
-    return {"repo_path": str(target_dir), "owner": owner, "name": name}
+    clone_info = {"repo_path": str(target_dir), "owner": owner, "name": name}
+    with _CLONE_CACHE_LOCK:
+        _CLONE_CACHE[cache_key] = (time.monotonic(), clone_info)
+    return dict(clone_info)
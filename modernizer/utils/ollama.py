@@ -2,16 +2,26 @@
 
 This module exposes a single factory, `get_llm()`, which returns a
 shared ChatOllama instance configured for qwen2.5-coder:7b running on a
-local Ollama server. All calls are traced locally to a log file so you
-can inspect prompts and responses without any cloud dependency.
+local Ollama server. Calls are traced locally to a log file (unless
+MODERNIZER_LLM_TRACE=0) so you can inspect prompts and responses without
+any cloud dependency, and responses are cached on disk (unless
+MODERNIZER_LLM_CACHE=0, and bounded to the newest LLM_CACHE_MAX_ENTRIES)
+so identical prompts are answered without calling the model again.
 """
 
+import os
+import sqlite3
+import threading
+from contextlib import closing
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from langchain_community.chat_models import ChatOllama
 from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+
+if TYPE_CHECKING:
+    from langchain_community.chat_models import ChatOllama
 
 
 DEFAULT_OLLAMA_BASE_URL = "http://localhost:11434"
@@ -23,22 +33,116 @@ DEFAULT_TEMPERATURE = 0.1
 DEFAULT_MAX_TOKENS = 768
 
 TRACE_FILE = Path("output/llm_trace.log")
+# Set MODERNIZER_LLM_TRACE=0 to skip writing the trace altogether.
+TRACE_ENABLED = os.environ.get("MODERNIZER_LLM_TRACE", "1") != "0"
+# The trace is appended to across runs and packaged into every ZIP; once it
+# grows past this size it is rolled over to a single `.1` backup.
+TRACE_MAX_BYTES = 5 * 1024 * 1024
+# Kept outside output/ so the cache is not packaged into the ZIP archive, and
+# anchored to the project root so it does not depend on the working directory.
+LLM_CACHE_FILE = Path(__file__).resolve().parents[2] / ".cache" / "llm_cache.db"
+# Set MODERNIZER_LLM_CACHE=0 to always call the model instead of the cache.
+LLM_CACHE_ENABLED = os.environ.get("MODERNIZER_LLM_CACHE", "1") != "0"
+# Every cached prompt embeds a full file tree; keep only the most recently
+# stored responses so the database does not grow without bound.
+LLM_CACHE_MAX_ENTRIES = 500
+# Agents may call the shared LLM from several threads at once; the lock keeps
+# each START and END block contiguous, but blocks of concurrent calls can
+# still interleave, so both headers carry the call's run id.
+_TRACE_LOCK = threading.Lock()
+
+
+def _rotate_trace_file() -> None:
+    """Roll the trace file over to `<name>.1` once it exceeds TRACE_MAX_BYTES.
+
+    Must be called with `_TRACE_LOCK` held.
+    """
+
+    try:
+        if TRACE_FILE.stat().st_size < TRACE_MAX_BYTES:
+            return
+    except FileNotFoundError:
+        return
+    TRACE_FILE.replace(TRACE_FILE.with_name(TRACE_FILE.name + ".1"))
+
+
+def _prune_llm_cache() -> None:
+    """Delete all but the newest LLM_CACHE_MAX_ENTRIES cached responses."""
+
+    if not LLM_CACHE_FILE.exists():
+        return
+
+    with closing(sqlite3.connect(LLM_CACHE_FILE)) as conn, conn:
+        try:
+            # Rows are never re-inserted on a cache hit, so rowid order is
+            # the order in which responses were stored.
+            conn.execute(
+                "DELETE FROM full_llm_cache"
+                " WHERE rowid <= (SELECT MAX(rowid) FROM full_llm_cache) - ?",
+                (LLM_CACHE_MAX_ENTRIES,),
+            )
+        except sqlite3.OperationalError:
+            # The cache table is only created on first use.
+            pass
+
+
+def forget_cached_response(llm: BaseChatModel, prompt: str) -> None:
+    """Drop the cached response to `llm.invoke(prompt)`, if there is one.
+
+    Agents call this when a response turns out to be unusable (for example
+    truncated JSON) so the next run asks the model again instead of
+    replaying it from the cache.
+    """
+
+    from langchain.globals import get_llm_cache
+    from langchain_community.cache import SQLAlchemyCache
+    from langchain_core.load import dumps
+    from langchain_core.messages import HumanMessage
+    from sqlalchemy.orm import Session
+
+    cache = get_llm_cache()
+    if not isinstance(cache, SQLAlchemyCache):
+        return
+
+    # Same key LangChain's chat models use when looking up a plain string
+    # prompt invoked without stop words.
+    cached_prompt = dumps([HumanMessage(content=prompt)])
+    llm_string = llm._get_llm_string()
+
+    schema = cache.cache_schema
+    with Session(cache.engine) as session, session.begin():
+        session.query(schema).filter(
+            schema.prompt == cached_prompt, schema.llm == llm_string
+        ).delete()
 
 
 class SimpleTraceHandler(BaseCallbackHandler):
-    """Log prompts and responses from the local LLM to a file."""
+    """Log prompts and responses from the local LLM to a file.
+
+    Each START and END header includes the LangChain run id, so a response
+    can be matched to its prompt even when calls overlap or the START was
+    rotated into the backup file.
+    """
 
     def on_llm_start(self, serialized, prompts, **kwargs):  # type: ignore[override]
         TRACE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with TRACE_FILE.open("a", encoding="utf-8") as f:
-            f.write("\n=== LLM START ===\n")
-            for p in prompts:
-                f.write(f"PROMPT:\n{p}\n")
+        with _TRACE_LOCK:
+            _rotate_trace_file()
+            with TRACE_FILE.open("a", encoding="utf-8") as f:
+                f.write(f"\n=== LLM START {kwargs.get('run_id')} ===\n")
+                # Write prompts in pieces rather than formatting a copy of
+                # each (often very large) prompt first.
+                for p in prompts:
+                    f.write("PROMPT:\n")
+                    f.write(p)
+                    f.write("\n")
 
     def on_llm_end(self, response, **kwargs):  # type: ignore[override]
-        with TRACE_FILE.open("a", encoding="utf-8") as f:
-            f.write("--- LLM END ---\n")
-            f.write(f"RESPONSE:\n{response.generations}\n")
+        with _TRACE_LOCK, TRACE_FILE.open("a", encoding="utf-8") as f:
+            f.write(f"--- LLM END {kwargs.get('run_id')} ---\n")
+            f.write("RESPONSE:\n")
+            f.write(str(response.generations))
+            f.write("\n")
 
 
 @lru_cache(maxsize=1)
@@ -47,18 +151,33 @@ def get_llm(
     base_url: str = DEFAULT_OLLAMA_BASE_URL,
     temperature: float = DEFAULT_TEMPERATURE,
     num_predict: int = DEFAULT_MAX_TOKENS,
-) -> ChatOllama:
+) -> "ChatOllama":
     """Return a shared ChatOllama instance.
 
     All agents in the modernizer should call this instead of constructing
     their own LLMs to ensure consistent configuration and efficient reuse.
     """
 
+    # Imported lazily: langchain_community.chat_models eagerly imports every
+    # chat model integration, which would otherwise slow down app start-up
+    # before a modernization run is ever requested.
+    from langchain.globals import set_llm_cache
+    from langchain_community.cache import SQLiteCache
+    from langchain_community.chat_models import ChatOllama
+
+    # Responses are keyed on the full prompt and model settings. Prompts embed
+    # the repository file tree and target stacks, so re-running an unchanged
+    # repository, even from a new session, is served from disk.
+    if LLM_CACHE_ENABLED:
+        LLM_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _prune_llm_cache()
+        set_llm_cache(SQLiteCache(database_path=str(LLM_CACHE_FILE)))
+
     llm = ChatOllama(
         model=model,
         base_url=base_url,
         temperature=temperature,
         num_predict=num_predict,
-        callbacks=[SimpleTraceHandler()],
+        callbacks=[SimpleTraceHandler()] if TRACE_ENABLED else None,
     )
     return llm
@@ -0,0 +1,39 @@
+"""Prompt rendering helpers shared by the modernization agents."""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping
+
+
+_PLACEHOLDER_RE = re.compile(r"\{\{ (\w+) \}\}")
+
+
+@lru_cache(maxsize=None)
+def load_prompt(path: Path) -> str:
+    """Read a prompt template from disk once and reuse it for later runs.
+
+    Templates ship with the package and do not change while the app is
+    running, so each agent run can skip the file read.
+    """
+
+    return path.read_text(encoding="utf-8")
+
+
+def stack_values(project_context: Mapping[str, Any]) -> Dict[str, str]:
+    """Return the target stack selections that every agent prompt includes."""
+
+    return {
+        "backend_stack": project_context["backend_stack"],
+        "frontend_stack": project_context["frontend_stack"],
+        "database": project_context["database"],
+    }
+
+
+def render_prompt(template: str, values: Mapping[str, str]) -> str:
+    """Fill `{{ name }}` placeholders in a single pass over the template.
+
+    Placeholders without a matching entry in `values` are left untouched.
+    """
+
+    return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)